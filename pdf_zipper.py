@@ -0,0 +1,535 @@
+import os
+import sys
+import argparse
+import codecs
+import hashlib
+import mmap
+from fpdf import FPDF
+from collections import deque
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from fpdf.enums import XPos, YPos
+from urllib.request import urlopen
+
+__all__ = ["CodePDF", "convert_directory_to_pdf", "generate_folder_tree", "main"]
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# The tool's own sources: this module and the pdf-zipper.py entry point are never put in the PDF.
+SCRIPT_PATHS = [os.path.abspath(__file__), os.path.join(SCRIPT_DIR, "pdf-zipper.py")]
+
+# Constants for font retrieval
+FONT_URL = "https://github.com/dejavu-fonts/dejavu-fonts/raw/master/ttf/DejaVuSansMono.ttf"
+FONT_PATH = os.path.join(SCRIPT_DIR, "DejaVuSansMono.ttf")
+FONT_DOWNLOAD_CHUNK = 64 * 1024
+FONT_DOWNLOAD_TIMEOUT = 30  # Seconds to wait on a stalled connection before giving up
+# Leading bytes of TrueType/OpenType font files.
+TRUETYPE_SIGNATURES = (b"\x00\x01\x00\x00", b"true", b"OTTO")
+
+# Files are read on a thread pool while the PDF is laid out; fpdf itself is not thread-safe,
+# so only reading happens in the background and at most READ_AHEAD files are held in memory.
+READ_WORKERS = 8
+READ_AHEAD = 16
+
+# Number of leading bytes inspected to detect binary files before reading them in full.
+BINARY_SNIFF_SIZE = 512
+# A prefix whose share of undecodable UTF-8 characters exceeds this is treated as binary.
+BINARY_ERROR_RATIO = 0.3
+
+# Files longer than MAX_FILE_CHARS are cut down to their first TRUNCATED_FILE_CHARS characters.
+MAX_FILE_CHARS = 100000
+TRUNCATED_FILE_CHARS = 50000
+# A UTF-8 character is at most 4 bytes, so this many bytes always covers MAX_FILE_CHARS + 1 characters.
+MAX_FILE_BYTES = 4 * (MAX_FILE_CHARS + 1)
+
+# Files larger than this are memory-mapped rather than read through a buffered file object.
+MMAP_THRESHOLD = 64 * 1024
+
+# Files that are listed in the PDF by name only: lock files and minified bundles are large
+# and carry no useful information, and anything over the size cap is skipped as well.
+# Patterns are exact file names, or name suffixes when they start with "*".
+DEFAULT_SKIP_PATTERNS = ("package-lock.json", "yarn.lock", "*.min.js", "*.min.css")
+DEFAULT_MAX_FILE_SIZE = 256 * 1024
+
+
+def download_font(path: str):
+    """Download the font to path, checking that the transfer completed and produced a TrueType file."""
+    received = 0
+    with urlopen(FONT_URL, timeout=FONT_DOWNLOAD_TIMEOUT) as response, open(path, "wb") as f:
+        expected = response.headers.get("Content-Length")
+        while True:
+            chunk = response.read(FONT_DOWNLOAD_CHUNK)
+            if not chunk:
+                break
+            f.write(chunk)
+            received += len(chunk)
+
+    if expected is not None and received != int(expected):
+        raise IOError(f"incomplete download ({received} of {expected} bytes)")
+    with open(path, "rb") as f:
+        if f.read(4) not in TRUETYPE_SIGNATURES:
+            raise ValueError("downloaded file is not a TrueType font")
+
+
+def ensure_font_exists():
+    """Ensure the DejaVu Sans Mono font is available and supports Unicode."""
+    if os.path.exists(FONT_PATH):
+        return
+
+    print(f"Downloading font to {FONT_PATH}...")
+    # Download next to the target and move it into place only once complete, so an interrupted
+    # or truncated download can never be mistaken for the font on a later run.
+    part_path = FONT_PATH + ".part"
+    try:
+        download_font(part_path)
+        os.replace(part_path, FONT_PATH)
+        print("Font downloaded successfully!")
+    except Exception as e:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        print(f"Error downloading font: {e}")
+        print("You need to manually download DejaVuSansMono.ttf and place it in the same directory.")
+        sys.exit(1)
+
+
+class CodePDF(FPDF):
+    LINE_HEIGHT = 4
+    HEADER_HEIGHT = 7
+    SPACER_HEIGHT = 5
+    # A file starts on a new page unless its header and the first few lines fit on the current one.
+    MIN_FILE_HEIGHT = 30
+
+    def __init__(self, title="Code Collection", margin=10, line_width=110, seen_hashes=None):
+        # Initialize PDF with landscape orientation to support wider lines of code.
+        super().__init__(orientation="L", unit="mm", format="A4")
+
+        self.set_margins(left=margin, top=margin, right=margin)
+        self.set_auto_page_break(auto=True, margin=margin)
+        self.line_width = line_width
+        # Deflate page content streams; fpdf2 enables this by default, but the output relies on it.
+        self.set_compression(True)
+        # fpdf2 always stamps a CreationDate; SOURCE_DATE_EPOCH pins it so identical input gives identical files.
+        source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        if source_date_epoch:
+            self.set_creation_date(datetime.fromtimestamp(int(source_date_epoch), timezone.utc))
+        # Content digest -> path of the first file written with that content; may be shared between
+        # documents so duplicates are still detected when every file gets its own PDF.
+        self._seen_hashes = {} if seen_hashes is None else seen_hashes
+        self.add_page()
+
+        try:
+            # TTF fonts are Unicode-capable and fpdf2 embeds only the glyphs actually used.
+            self.add_font("DejaVu", "", FONT_PATH)
+            self.set_font("DejaVu", size=8)
+        except Exception as e:
+            print(f"Error adding font: {e}")
+            print("Falling back to Courier")
+            self.set_font("Courier", size=8)
+
+        # Add the title to the first page
+        if title is not None:
+            self.set_font_size(14)
+            self.cell(0, 10, title, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+            self.set_font_size(8)
+
+    def _wrap_line(self, line: str) -> tuple:
+        """Splits a source line into the physical lines it occupies in the PDF."""
+        if not line.strip():
+            return ("",)
+        width = self.line_width
+        if len(line) <= width:
+            return (line,)
+
+        # The font is monospace, so fixed-width slices wrap exactly at the column limit.
+        indent = '    ' if line.startswith(' ') else ''
+        step = max(width - len(indent), 1)
+        return (line[:width],) + tuple(indent + line[i:i + step] for i in range(width, len(line), step))
+
+    def write_code_block(self, code: str):
+        """Writes a block of code to the PDF with proper formatting."""
+        lines = []
+        for line in code.splitlines():
+            lines.extend(self._wrap_line(line))
+
+        # Every line shares one style on a monospace grid, so lines are emitted straight into the
+        # content stream with text() instead of going through cell() layout; page breaks are handled here.
+        # text() wraps every line in its own colour-state block while fill and text colours differ.
+        self.set_text_color(0, 0, 0)
+        self.set_fill_color(0, 0, 0)
+        x = self.l_margin + self.c_margin
+        baseline = 0.5 * self.LINE_HEIGHT + 0.3 * self.font_size  # Same text placement as cell()
+        for line in lines:
+            if self.will_page_break(self.LINE_HEIGHT):
+                self.add_page()
+            if line:
+                self.text(x, self.y + baseline, line)
+            self.ln(self.LINE_HEIGHT)
+
+    def write_header(self, text: str):
+        """Writes a blue file header line."""
+        self.set_fill_color(70, 130, 180)
+        self.set_text_color(255, 255, 255)  # White text on blue background
+        self.cell(0, self.HEADER_HEIGHT, text, fill=True, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        self.set_text_color(0, 0, 0)  # Reset to black text
+
+    def write_file(self, path: str, code: str = None, note: str = None, truncated: bool = False):
+        """Adds a file's content to the PDF.
+
+        Only the header is written, annotated with note, when code is None or identical content
+        was already added. Truncated content is never treated as a duplicate, since files that
+        share a prefix may still differ past the cut.
+        """
+        digest = None
+        if code is not None:
+            # Empty files are left alone; pointing one __init__.py at another would only add noise.
+            dedupe = code.strip() and not truncated
+            digest = hashlib.sha1(code.encode("utf-8", "ignore")).digest() if dedupe else None
+            original_path = self._seen_hashes.get(digest)
+            if original_path is not None:
+                code, digest, note = None, None, f"identical to {original_path}"
+
+        # Break pages explicitly so the header cell itself never triggers fpdf's auto page break.
+        if self.will_page_break(self.MIN_FILE_HEIGHT):
+            self.add_page()
+
+        self.write_header(f"File: {path} ({note})" if note else f"File: {path}")
+        if code is not None:
+            self.write_code_block(code)
+        # Recorded only once the body is written, so a failed write never becomes an "original".
+        if digest is not None:
+            self._seen_hashes[digest] = path
+
+        # An empty spacer that would spill over is dropped rather than opening a page for it.
+        if not self.will_page_break(self.SPACER_HEIGHT):
+            self.cell(0, self.SPACER_HEIGHT, "", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+    def insert_folder_tree(self, folder_structure: str):
+        """Insert the folder tree structure into the PDF."""
+        self.add_page()
+        self.set_font("DejaVu", size=8)
+        self.set_text_color(0, 0, 255)  # Blue text for folder structure
+        for line in folder_structure.splitlines():
+            self.cell(0, 5, line, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        self.set_text_color(0, 0, 0)  # Reset to black for other content
+
+
+def generate_folder_tree(directory: str) -> str:
+    """Generate folder tree structure as a string."""
+    tree_lines = []
+    for _ in iter_source_files(directory, (), frozenset(), tree_lines):
+        pass
+    return "".join(f"{line}\n" for line in tree_lines)
+
+
+def iter_source_files(directory: str, extensions: tuple, exclude: frozenset, tree_lines=None, depth=0):
+    """Yield (path, size) for matching files under directory: each folder's files in name order,
+    then its subfolders.
+
+    Excluded folders are pruned without being scanned. When tree_lines is a list, the folder tree
+    is appended to it during the same walk; excluded entries and symlinked folders are left out.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError as e:
+        print(f"Error reading directory {directory}: {e}")
+        return
+
+    if tree_lines is not None:
+        tree_lines.append(f"{'    ' * depth}{os.path.basename(directory)}/")  # Visual indentation for hierarchy
+        file_indent = '    ' * (depth + 1)
+
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.path in exclude:
+                print(f"Skipping excluded directory: {entry.path}")
+                continue
+            subdirs.append(entry.path)
+            continue
+
+        if entry.is_dir():
+            continue  # Symlinked folders are not followed, as with the folder walk itself
+        matches = entry.name.endswith(extensions) and entry.is_file()
+        if entry.path in exclude:
+            if matches:
+                print(f"Skipping excluded file: {entry.path}")
+            continue
+        if tree_lines is not None:
+            tree_lines.append(file_indent + entry.name)
+        if matches:
+            try:
+                size = entry.stat().st_size
+            except OSError as e:
+                print(f"Error reading {entry.path}: {e}")
+                continue
+            yield entry.path, size
+
+    for subdir in subdirs:
+        yield from iter_source_files(subdir, extensions, exclude, tree_lines, depth + 1)
+
+
+def skip_reason(path: str, size: int, max_size: int, skip_patterns=DEFAULT_SKIP_PATTERNS):
+    """Return why a file should be left out of the PDF without reading it, or None to include it."""
+    name = os.path.basename(path)
+    for pattern in skip_patterns:
+        if name == pattern or (pattern.startswith("*") and name.endswith(pattern[1:])):
+            return f"matches {pattern}"
+    if max_size and size > max_size:
+        limit = f"{max_size // 1024} KB" if max_size % 1024 == 0 else f"{max_size} bytes"
+        return f"larger than {limit}"
+    return None
+
+
+def decode_source(data: bytes, final: bool = True) -> str:
+    """Decode UTF-8 source bytes, replacing invalid sequences with U+FFFD."""
+    if data.isascii():
+        return data.decode("ascii")  # The common case for source code needs no error handling at all
+    # With final=False a multi-byte character cut off at the end of a truncated read is dropped
+    # instead of being turned into a replacement character.
+    return codecs.getincrementaldecoder("utf-8")(errors="replace").decode(data, final=final)
+
+
+def looks_binary(prefix: bytes) -> bool:
+    """Guess whether a file is binary from its first bytes."""
+    if b"\0" in prefix:
+        return True  # NUL bytes never appear in text files
+    if prefix.isascii():
+        return False
+    # final=False keeps a character cut off at the end of the prefix from counting as an error.
+    text = codecs.getincrementaldecoder("utf-8")(errors="replace").decode(prefix, final=False)
+    return bool(text) and text.count("\ufffd") / len(text) > BINARY_ERROR_RATIO
+
+
+def read_file(path: str, size: int):
+    """Read a source file, truncating very large files.
+
+    Returns (code, truncated), with code set to None for binary files.
+    """
+    if size > MMAP_THRESHOLD:
+        # Map large files instead of reading them so only the prefix that can reach the PDF is copied.
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if looks_binary(mm[:BINARY_SNIFF_SIZE]):
+                return None, False
+            data = mm[:MAX_FILE_BYTES]
+    else:
+        with open(path, "rb") as f:
+            data = f.read(MAX_FILE_BYTES)
+        if looks_binary(data[:BINARY_SNIFF_SIZE]):
+            return None, False
+
+    code = decode_source(data, final=len(data) < MAX_FILE_BYTES)
+    truncated = len(code) > MAX_FILE_CHARS
+    if truncated:
+        code = code[:TRUNCATED_FILE_CHARS] + "\n\n... [File truncated due to size] ...\n\n"
+    return code, truncated
+
+
+def read_files_ahead(files, max_size: int, skip_patterns=DEFAULT_SKIP_PATTERNS):
+    """Yield (path, note, future) in order while reading up to READ_AHEAD files in the background.
+
+    Files rejected by skip_reason() are never read; they come back with the reason and no future.
+    """
+    files = iter(files)
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        def submit(path, size):
+            note = skip_reason(path, size, max_size, skip_patterns)
+            return path, note, None if note else executor.submit(read_file, path, size)
+
+        pending = deque(submit(path, size) for path, size in islice(files, READ_AHEAD))
+        while pending:
+            item = pending.popleft()
+            for path, size in islice(files, 1):
+                pending.append(submit(path, size))
+            yield item
+
+
+def save_pdf(pdf: CodePDF, output_path: str):
+    """Write the PDF to disk, exiting on failure."""
+    try:
+        pdf.output(output_path)
+    except Exception as e:
+        print(f"Error saving PDF: {e}")
+        sys.exit(1)
+
+
+def merge_pdfs(part_paths, output_path: str):
+    """Concatenate the per-file PDFs into a single document.
+
+    pypdf keeps every appended part in memory until the result is written, and each part carries
+    its own font subset, so the merged file is larger than a single-pass PDF.
+    """
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part_path in part_paths:
+        # Pages are copied as they are; their content streams are never decompressed.
+        writer.append(part_path)
+    with open(output_path, "wb") as f:
+        writer.write(f)
+
+
+def convert_directory_to_pdf(directory: str, output_path="output.pdf", extensions=None,
+                             title="Code Collection", line_width=110, exclude=None, add_tree=False,
+                             max_size=DEFAULT_MAX_FILE_SIZE, per_file_dir=None, merge=False,
+                             skip_patterns=DEFAULT_SKIP_PATTERNS):
+    """Convert the code directory into a structured PDF.
+
+    With per_file_dir, the title page and every file are written to their own numbered PDFs in
+    that folder, so only one file's layout is held in memory at a time. merge then combines the
+    parts into output_path, which loads all of them again (see merge_pdfs()).
+    """
+    if merge:
+        # Fail before any part is laid out rather than after all of them.
+        try:
+            import pypdf  # noqa: F401
+        except ImportError:
+            print("Merging per-file PDFs requires pypdf. Install it with: pip install pypdf")
+            sys.exit(1)
+
+    if per_file_dir is not None and os.path.isdir(per_file_dir):
+        # Parts left over from an earlier run would be mixed in with, and merged into, the new ones.
+        with os.scandir(per_file_dir) as it:
+            if any(it):
+                print(f"Error: {per_file_dir} is not empty; choose an empty or new folder for the parts")
+                sys.exit(1)
+
+    if extensions is None:
+        extensions = [
+            '.py', '.js', '.ts', '.jsx', '.tsx', '.cpp', '.c', '.h', '.hpp',
+            '.html', '.css', '.java', '.go', '.rs', '.php', '.rb', '.md',
+            '.json', '.yml', '.yaml', '.sh', '.sql', '.xml'
+        ]
+
+    # Resolve everything once up front; scandir paths under an absolute root are already absolute.
+    directory = os.path.abspath(directory)
+    exclude = frozenset([os.path.abspath(path) for path in exclude or ()] + SCRIPT_PATHS)
+
+    ensure_font_exists()
+    seen_hashes = {}
+    pdf = CodePDF(title=title, line_width=line_width, seen_hashes=seen_hashes)
+
+    # The folder tree, when requested, is collected by the same walk that finds the files
+    tree_lines = [] if add_tree else None
+    files_to_process = list(iter_source_files(directory, tuple(extensions), exclude, tree_lines))
+
+    if add_tree:
+        try:
+            pdf.insert_folder_tree("\n".join(tree_lines))
+        except Exception as e:
+            print(f"Error generating folder tree: {e}")
+
+    part_paths = []
+
+    def flush_part():
+        """In per-file mode, save what has been laid out so far and start a new document."""
+        nonlocal pdf
+        if per_file_dir is None:
+            return
+        part_path = os.path.join(per_file_dir, f"{len(part_paths):06d}.pdf")
+        save_pdf(pdf, part_path)
+        part_paths.append(part_path)
+        pdf = CodePDF(title=None, line_width=line_width, seen_hashes=seen_hashes)
+
+    if per_file_dir is not None:
+        os.makedirs(per_file_dir, exist_ok=True)
+        flush_part()
+
+    processed_files = 0
+    for full_path, skip_note, future in read_files_ahead(files_to_process, max_size, skip_patterns):
+        relative_path = os.path.relpath(full_path, directory)
+        if skip_note is not None:
+            # Keep a header for the file so the PDF still reflects the project structure.
+            print(f"Skipping {relative_path}: {skip_note}")
+            pdf.write_file(relative_path, note=f"skipped: {skip_note}")
+            flush_part()
+            continue
+
+        try:
+            code, truncated = future.result()
+            if code is None:
+                print(f"Skipping binary file: {relative_path}")
+                continue
+            pdf.write_file(relative_path, code, truncated=truncated)
+            processed_files += 1
+            flush_part()
+        except Exception as e:
+            print(f"Error processing {relative_path}: {e}")
+            if per_file_dir is not None:
+                # Throw away a partly written file instead of letting it leak into the next part.
+                pdf = CodePDF(title=None, line_width=line_width, seen_hashes=seen_hashes)
+
+    if per_file_dir is None:
+        save_pdf(pdf, output_path)
+        print(f"PDF saved to {output_path}")
+    else:
+        print(f"{len(part_paths)} PDF parts saved to {per_file_dir}")
+        if merge:
+            merge_pdfs(part_paths, output_path)
+            print(f"Merged PDF saved to {output_path}")
+
+    return processed_files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a code directory to a PDF")
+    parser.add_argument("directory", nargs="?", default=".", help="Directory to convert (default: current directory)")
+    parser.add_argument("-o", "--output", help="Output PDF file path (default: code_collection.pdf)")
+    parser.add_argument("-t", "--title", default="Code Collection", help="PDF title")
+    parser.add_argument("-e", "--extensions", help="Comma-separated list of file extensions to include")
+    parser.add_argument("-w", "--width", type=int, default=110, help="Maximum line width in characters")
+    parser.add_argument("-x", "--exclude", help="Comma-separated list of files or patterns to exclude")
+    parser.add_argument("-i", "--image", action="store_true", help="Include folder tree structure in the PDF")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_FILE_SIZE // 1024,
+                        help="Skip files larger than this many KB (default: 256, 0 disables the limit)")
+    parser.add_argument("--skip", default=",".join(DEFAULT_SKIP_PATTERNS),
+                        help="Comma-separated file names, or *suffixes, listed by name only "
+                             "(default: %(default)s; pass an empty string to disable)")
+    parser.add_argument("--per-file-dir", help="Write one PDF per file into this directory instead of a single PDF")
+    parser.add_argument("--merge", action="store_true",
+                        help="With --per-file-dir, also merge the per-file PDFs into the output file (requires pypdf)")
+
+    args = parser.parse_args()
+    if args.max_size < 0:
+        parser.error("--max-size must be 0 or greater")
+    if args.merge and not args.per_file_dir:
+        parser.error("--merge requires --per-file-dir")
+    if args.output is not None and args.per_file_dir and not args.merge:
+        print(f"Warning: --output {args.output} is ignored without --merge; parts go to {args.per_file_dir}")
+    output_path = args.output or "code_collection.pdf"
+
+    directory = os.path.abspath(args.directory)
+    if not os.path.isdir(directory):
+        print(f"Error: {directory} is not a directory")
+        sys.exit(1)
+
+    extensions = None
+    if args.extensions:
+        extensions = [ext.strip() if ext.strip().startswith('.') else f'.{ext.strip()}' for ext in args.extensions.split(',')]
+
+    exclude_list = []
+    if args.exclude:
+        exclude_list = [os.path.abspath(os.path.join(directory, path.strip())) for path in args.exclude.split(',')]
+
+    try:
+        processed = convert_directory_to_pdf(
+            directory=directory,
+            output_path=output_path,
+            extensions=extensions,
+            title=args.title,
+            line_width=args.width,
+            exclude=exclude_list,
+            add_tree=args.image,
+            max_size=args.max_size * 1024,
+            skip_patterns=tuple(pattern.strip() for pattern in args.skip.split(',') if pattern.strip()),
+            per_file_dir=args.per_file_dir,
+            merge=args.merge
+        )
+        print(f"Successfully processed {processed} files")
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()